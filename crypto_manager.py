@@ -1,16 +1,113 @@
 """
 Cryptographic Security Module
 Handles encryption, decryption, key derivation, and Master Password management.
-Uses AES-256 encryption via Fernet with PBKDF2 key derivation.
+Uses AES-256-GCM authenticated encryption with PBKDF2 key derivation.
 """
 
 import os
 import base64
+import functools
+import operator
+import time
+import warnings
+import hashlib
+import hmac
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
 import bcrypt
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+try:
+    # Optional Rust implementation of the same token format, ~4x faster
+    from rfernet import Fernet as _Fernet
+except ImportError:
+    _Fernet = Fernet
+
+
+@functools.lru_cache(maxsize=1)
+def _read_salt_file(path: str, mtime_ns: int) -> bytes:
+    """
+    Read the salt file, cached so re-authentication skips the disk read.
+    
+    Args:
+        path: Salt file path
+        mtime_ns: Modification time, so a replaced file is re-read
+        
+    Returns:
+        Raw file contents
+    """
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=1)
+def _cpu_has_sha_extensions() -> Optional[bool]:
+    """
+    Detect hardware SHA-256 support (x86 SHA-NI or ARMv8 SHA2).
+    
+    Reads /proc/cpuinfo where available and falls back to the optional
+    py-cpuinfo package, which is much slower to query.
+    
+    Returns:
+        True/False, or None if the CPU flags cannot be determined
+    """
+    flags = set()
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                name, _, value = line.partition(':')
+                if name.strip() in ('flags', 'Features'):
+                    flags.update(value.split())
+    except OSError:
+        try:
+            import cpuinfo
+        except ImportError:
+            return None
+        flags.update(cpuinfo.get_cpu_info().get('flags', []))
+    if not flags:
+        return None
+    return bool(flags & {'sha_ni', 'sha', 'sha2'})
+
+
+def _build_class_lut(special_chars: frozenset) -> bytes:
+    """
+    Build a byte -> character-class bitmask lookup table.
+    
+    Args:
+        special_chars: Characters counted as special
+        
+    Returns:
+        256-entry table (upper=1, lower=2, digit=4, special=8)
+    """
+    lut = bytearray(256)
+    for i in range(128):
+        c = chr(i)
+        if c.isupper():
+            lut[i] = 1
+        elif c.islower():
+            lut[i] = 2
+        elif c.isdigit():
+            lut[i] = 4
+        elif c in special_chars:
+            lut[i] = 8
+    return bytes(lut)
+
+
+def _class_mask(data: bytes) -> int:
+    """
+    OR together the character-class bits of every byte in an ASCII string.
+    
+    Args:
+        data: ASCII-encoded password
+        
+    Returns:
+        Bitmask of the classes present (see CryptoManager.CLASS_LUT)
+    """
+    # Single C-level translate pass, then OR the class bits together
+    return functools.reduce(operator.or_, data.translate(CryptoManager.CLASS_LUT), 0)
 
 
 class CryptoManager:
@@ -18,6 +115,15 @@ class CryptoManager:
     
     SALT_FILE = "salt.key"
     ITERATIONS = 480000  # High iteration count for security
+    BCRYPT_ROUNDS = 12  # Default Master Password hash cost
+    MIN_BCRYPT_ROUNDS = 10  # Lowest cost fast_mode may calibrate down to
+    SALT_MAGIC = b"SPMK"  # Marks a versioned salt file
+    KDF_VERSIONS = {1: 'sha256', 2: 'sha512'}  # Version byte -> PBKDF2 hash
+    KDF_VERSION = 2  # Used when creating a new vault
+    NONCE_SIZE = 12  # 96-bit nonce, the size AES-GCM is designed for
+    DECRYPT_CACHE_SIZE = 256  # Decrypted values kept per unlocked session
+    SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+    CLASS_LUT = _build_class_lut(SPECIAL_CHARS)
     
     def __init__(self, master_password: str):
         """
@@ -27,46 +133,64 @@ class CryptoManager:
             master_password: The user's Master Password
         """
         self.master_password = master_password
-        self.salt = self._load_or_create_salt()
+        self.salt, self.kdf_hash = self._load_or_create_salt()
         self.key = self._derive_key()
-        self.fernet = Fernet(self.key)
+        self.aead = AESGCM(self.key)
+        self._legacy_fernet: _Fernet | None = None
+        self._dec_cache: OrderedDict = OrderedDict()  # ciphertext -> plaintext (LRU)
     
-    def _load_or_create_salt(self) -> bytes:
+    def _load_or_create_salt(self) -> tuple[bytes, str]:
         """
         Load existing salt from file or create a new one.
         
+        New salt files start with SALT_MAGIC and a KDF version byte; files
+        holding only the raw 16-byte salt predate versioning and use SHA-256.
+        
         Returns:
-            16-byte salt
+            Tuple of (16-byte salt, PBKDF2 hash name)
         """
-        if os.path.exists(self.SALT_FILE):
-            with open(self.SALT_FILE, 'rb') as f:
-                return f.read()
+        try:
+            mtime = os.stat(self.SALT_FILE).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        
+        if mtime is not None:
+            data = _read_salt_file(self.SALT_FILE, mtime)
+            header_size = len(self.SALT_MAGIC) + 1
+            if len(data) == header_size + 16 and data.startswith(self.SALT_MAGIC):
+                version = data[header_size - 1]
+                if version not in self.KDF_VERSIONS:
+                    raise ValueError(f"Unsupported salt file version: {version}")
+                return data[header_size:], self.KDF_VERSIONS[version]
+            return data, self.KDF_VERSIONS[1]
         else:
             # Generate cryptographically random 16-byte salt
             salt = os.urandom(16)
             with open(self.SALT_FILE, 'wb') as f:
-                f.write(salt)
-            return salt
+                f.write(self.SALT_MAGIC + bytes([self.KDF_VERSION]) + salt)
+                f.flush()
+                os.fsync(f.fileno())  # Losing the salt loses the vault
+            return salt, self.KDF_VERSIONS[self.KDF_VERSION]
     
     def _derive_key(self) -> bytes:
         """
         Derive encryption key from Master Password using PBKDF2.
         
+        hashlib calls straight into OpenSSL's PKCS5_PBKDF2_HMAC, which
+        reuses the precomputed HMAC inner/outer pads across iterations.
+        SHA-512's 64-bit arithmetic makes each iteration cheaper than
+        SHA-256 on 64-bit CPUs, so new vaults use it.
+        
         Returns:
-            Base64-encoded 32-byte key suitable for Fernet
+            Raw 32-byte key suitable for AES-256-GCM
         """
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=self.salt,
-            iterations=self.ITERATIONS,
-            backend=default_backend()
-        )
-        key = kdf.derive(self.master_password.encode())
-        # Fernet requires base64-encoded key
-        return base64.urlsafe_b64encode(key)
+        if self.kdf_hash == 'sha256' and _cpu_has_sha_extensions() is False:
+            warnings.warn("CPU lacks SHA-256 instructions; unlocking this vault "
+                          "(PBKDF2-HMAC-SHA256) will be slower", RuntimeWarning)
+        return hashlib.pbkdf2_hmac(self.kdf_hash, self.master_password.encode(),
+                                   self.salt, self.ITERATIONS, 32)
     
-    def encrypt(self, plaintext: str) -> str:
+    def encrypt(self, plaintext: str) -> bytes:
         """
         Encrypt a plaintext string.
         
@@ -74,45 +198,186 @@ class CryptoManager:
             plaintext: The text to encrypt
             
         Returns:
-            Encrypted text as string
+            Nonce followed by the AES-GCM ciphertext, as raw bytes
         """
         if not plaintext:
-            return ""
-        encrypted_bytes = self.fernet.encrypt(plaintext.encode())
-        return encrypted_bytes.decode()
+            return b""
+        nonce = os.urandom(self.NONCE_SIZE)
+        return nonce + self.aead.encrypt(nonce, plaintext.encode(), None)
     
-    def decrypt(self, ciphertext: str) -> str:
+    def encrypt_many(self, plaintexts: list[str]) -> list[bytes]:
         """
-        Decrypt a ciphertext string.
+        Encrypt several plaintext strings in one batch.
+        
+        All nonces are drawn with a single os.urandom call and the AEAD
+        instance is reused, so bulk imports avoid per-field setup cost.
+        
+        Args:
+            plaintexts: The texts to encrypt
+            
+        Returns:
+            Encrypted texts, in the same order as the input
+        """
+        size = self.NONCE_SIZE
+        nonces = os.urandom(size * len(plaintexts))
+        aead_encrypt = self.aead.encrypt
+        
+        results = []
+        for i, plaintext in enumerate(plaintexts):
+            if not plaintext:
+                results.append(b"")
+                continue
+            nonce = nonces[i * size:(i + 1) * size]
+            results.append(nonce + aead_encrypt(nonce, plaintext.encode(), None))
+        return results
+    
+    def decrypt_many(self, ciphertexts: list[Union[bytes, str]]) -> list[str]:
+        """
+        Decrypt several ciphertext strings in one batch.
         
         Args:
-            ciphertext: The encrypted text
+            ciphertexts: The encrypted texts
+            
+        Returns:
+            Decrypted plaintexts, in the same order as the input
+        """
+        decrypt = self.decrypt
+        return [decrypt(ciphertext) for ciphertext in ciphertexts]
+    
+    def decrypt(self, ciphertext: Union[bytes, str]) -> str:
+        """
+        Decrypt a ciphertext.
+        
+        Results are memoized in a small LRU cache so repeated reveals of the
+        same credential skip the AEAD work; wipe() clears it on lock.
+        
+        Args:
+            ciphertext: Raw nonce + AES-GCM ciphertext, or a text token
+                        written by older versions of the vault
             
         Returns:
             Decrypted plaintext
         """
         if not ciphertext:
             return ""
+        
+        cache = self._dec_cache
+        plaintext = cache.get(ciphertext)
+        if plaintext is not None:
+            cache.move_to_end(ciphertext)
+            return plaintext
+        
+        plaintext = self._decrypt_uncached(ciphertext)
+        cache[ciphertext] = plaintext
+        if len(cache) > self.DECRYPT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return plaintext
+    
+    def _decrypt_uncached(self, ciphertext: Union[bytes, str]) -> str:
+        """
+        Decrypt a non-empty ciphertext without consulting the cache.
+        
+        Args:
+            ciphertext: Raw bytes or a legacy text token
+            
+        Returns:
+            Decrypted plaintext
+        """
+        if isinstance(ciphertext, str):
+            return self._decrypt_legacy(ciphertext)
         try:
-            decrypted_bytes = self.fernet.decrypt(ciphertext.encode())
+            nonce, payload = ciphertext[:self.NONCE_SIZE], ciphertext[self.NONCE_SIZE:]
+            return self.aead.decrypt(nonce, payload, None).decode()
+        except Exception as e:
+            raise ValueError(f"Decryption failed: {str(e)}")
+    
+    def _decrypt_legacy(self, ciphertext: str) -> str:
+        """
+        Decrypt a text token written by older versions of the vault.
+        
+        These are either base64-encoded nonce + AES-GCM ciphertext or,
+        for vaults predating AES-GCM, Fernet tokens.
+        
+        Args:
+            ciphertext: The base64 or Fernet token
+            
+        Returns:
+            Decrypted plaintext
+        """
+        try:
+            data = base64.b64decode(ciphertext.encode())
+            nonce, payload = data[:self.NONCE_SIZE], data[self.NONCE_SIZE:]
+            return self.aead.decrypt(nonce, payload, None).decode()
+        except (InvalidTag, ValueError):
+            pass
+        
+        try:
+            if self._legacy_fernet is None:
+                key = base64.urlsafe_b64encode(self.key).decode()
+                self._legacy_fernet = _Fernet(key)
+            decrypted_bytes = self._legacy_fernet.decrypt(ciphertext)
             return decrypted_bytes.decode()
         except Exception as e:
             raise ValueError(f"Decryption failed: {str(e)}")
     
-    @staticmethod
-    def hash_master_password(password: str) -> str:
+    def wipe(self):
+        """
+        Drop decrypted values and key material when the vault locks.
+        
+        Python strings and bytes are immutable and may be shared, so they
+        cannot be safely zeroed in place; releasing every reference is the
+        most that can be done portably.
+        """
+        self._dec_cache.clear()
+        self._legacy_fernet = None
+        self.aead = None
+        self.key = None
+        self.master_password = None
+    
+    @classmethod
+    def hash_master_password(cls, password: str, fast_mode: bool = False) -> str:
         """
         Create bcrypt hash of Master Password for verification.
         
+        The cost factor is stored inside the hash, so a vault keeps the
+        cost chosen at setup and verification needs no extra state.
+        
         Args:
             password: The Master Password
+            fast_mode: Calibrate the cost for this CPU (for constrained
+                       devices) instead of using BCRYPT_ROUNDS
             
         Returns:
             Bcrypt hash as string
         """
-        hashed = bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=12))
+        rounds = cls.calibrate_bcrypt_rounds() if fast_mode else cls.BCRYPT_ROUNDS
+        hashed = bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=rounds))
         return hashed.decode()
     
+    @classmethod
+    def calibrate_bcrypt_rounds(cls, target_seconds: float = 0.1) -> int:
+        """
+        Find the bcrypt cost that takes about target_seconds on this CPU.
+        
+        Each extra round doubles the work, so a single timed hash at the
+        minimum cost is enough to extrapolate from.
+        
+        Args:
+            target_seconds: Desired verification time
+            
+        Returns:
+            Cost factor between MIN_BCRYPT_ROUNDS and BCRYPT_ROUNDS
+        """
+        rounds = cls.MIN_BCRYPT_ROUNDS
+        start = time.perf_counter()
+        bcrypt.hashpw(b"calibration", bcrypt.gensalt(rounds=rounds))
+        elapsed = time.perf_counter() - start
+        
+        while rounds < cls.BCRYPT_ROUNDS and elapsed * 2 <= target_seconds:
+            elapsed *= 2
+            rounds += 1
+        return rounds
+    
     @staticmethod
     def verify_master_password(password: str, hashed: str) -> bool:
         """
@@ -126,10 +391,35 @@ class CryptoManager:
             True if password matches, False otherwise
         """
         try:
-            return bcrypt.checkpw(password.encode(), hashed.encode())
+            stored = hashed.encode()
+            expected = bcrypt.hashpw(password.encode(), stored)
+            # Constant-time comparison regardless of the bcrypt binding
+            return hmac.compare_digest(expected, stored)
         except Exception:
             return False
     
+    @classmethod
+    def unlock(cls, password: str, hashed: str) -> Optional["CryptoManager"]:
+        """
+        Verify a Master Password and derive the vault key concurrently.
+        
+        bcrypt and PBKDF2 both release the GIL while hashing, so running
+        them on two threads overlaps the two slowest steps of a login.
+        
+        Args:
+            password: The password to check
+            hashed: The stored bcrypt hash
+            
+        Returns:
+            Initialized CryptoManager, or None if the password is wrong
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            verified = executor.submit(cls.verify_master_password, password, hashed)
+            manager = executor.submit(cls, password)
+            if not verified.result():
+                return None
+            return manager.result()
+    
     @staticmethod
     def validate_password_strength(password: str) -> tuple[bool, str]:
         """
@@ -144,14 +434,17 @@ class CryptoManager:
         if len(password) < 8:
             return False, "Password must be at least 8 characters long"
         
-        has_upper = any(c.isupper() for c in password)
-        has_lower = any(c.islower() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password)
-        
-        strength_checks = [has_upper, has_lower, has_digit, has_special]
+        if password.isascii():
+            num_classes = bin(_class_mask(password.encode())).count('1')
+        else:
+            has_upper = any(c.isupper() for c in password)
+            has_lower = any(c.islower() for c in password)
+            has_digit = any(c.isdigit() for c in password)
+            special_chars = CryptoManager.SPECIAL_CHARS
+            has_special = any(c in special_chars for c in password)
+            num_classes = sum([has_upper, has_lower, has_digit, has_special])
         
-        if sum(strength_checks) < 3:
+        if num_classes < 3:
             return False, "Password must contain at least 3 of: uppercase, lowercase, digit, special character"
         
         return True, ""
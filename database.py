@@ -4,7 +4,6 @@ Handles all SQLite database operations for the password vault.
 """
 
 import sqlite3
-from datetime import datetime
 from typing import List, Optional, Dict, Any
 
 
@@ -12,14 +11,38 @@ class Database:
     """Manages SQLite database for credential storage."""
     
     DB_FILE = "vault.db"
+    STATEMENT_CACHE_SIZE = 256
+    
+    # Static UPDATE statement: COALESCE keeps columns passed as None
+    _UPDATE_SQL = """
+        UPDATE credentials SET
+            website = COALESCE(?, website),
+            username = COALESCE(?, username),
+            encrypted_password = COALESCE(?, encrypted_password),
+            url = COALESCE(?, url),
+            notes = COALESCE(?, notes)
+        WHERE id = ?
+    """
     
     def __init__(self):
         """Initialize database connection and create tables if needed."""
-        self.conn = sqlite3.connect(self.DB_FILE)
-        self.conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        # A larger statement cache keeps every query this class issues prepared
+        self.conn = sqlite3.connect(self.DB_FILE,
+                                    cached_statements=self.STATEMENT_CACHE_SIZE)
         self.cursor = self.conn.cursor()
+        self._configure_connection()
         self._create_tables()
     
+    def _configure_connection(self):
+        """Tune SQLite for a single-user local vault."""
+        # WAL needs one fsync per commit instead of two and lets reads
+        # proceed alongside writes; NORMAL sync is still crash-safe in WAL
+        self.cursor.execute("PRAGMA journal_mode=WAL")
+        self.cursor.execute("PRAGMA synchronous=NORMAL")
+        self.cursor.execute("PRAGMA temp_store=MEMORY")
+        self.cursor.execute("PRAGMA mmap_size=134217728")  # 128 MiB
+        self.cursor.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+    
     def _create_tables(self):
         """Create database tables if they don't exist."""
         # Credentials table
@@ -28,7 +51,7 @@ class Database:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 website TEXT NOT NULL,
                 username TEXT NOT NULL,
-                encrypted_password TEXT NOT NULL,
+                encrypted_password BLOB NOT NULL,
                 url TEXT,
                 notes TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -36,6 +59,24 @@ class Database:
             )
         """)
         
+        # Stamp modified_at in SQL whenever a credential's data changes
+        self.cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS credentials_touch
+            AFTER UPDATE OF website, username, encrypted_password, url, notes
+            ON credentials BEGIN
+                UPDATE credentials SET modified_at = CURRENT_TIMESTAMP
+                WHERE id = new.id;
+            END
+        """)
+        
+        # Supports the ORDER BY used when listing credentials
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_cred_website
+            ON credentials (website, username)
+        """)
+        
+        self.has_fts = self._create_search_index()
+        
         # Settings table for storing Master Password hash
         self.cursor.execute("""
             CREATE TABLE IF NOT EXISTS settings (
@@ -46,6 +87,102 @@ class Database:
         
         self.conn.commit()
     
+    def _create_search_index(self) -> bool:
+        """
+        Create the FTS5 index over website/username and its sync triggers.
+        
+        The trigram tokenizer (SQLite 3.34+) keeps substring matching, so
+        "mail" still finds "gmail.com", while letting MATCH use the index.
+        
+        Returns:
+            True if the index is available, False if SQLite lacks FTS5 or
+            the trigram tokenizer
+        """
+        self.cursor.execute("""
+            SELECT name, sql FROM sqlite_master
+            WHERE name IN ('credentials_fts', 'credentials_fts_insert')
+        """)
+        schema = dict(self.cursor.fetchall())
+        if "trigram" not in schema.get('credentials_fts', "trigram"):
+            # Word-tokenized index from an earlier version only matches
+            # word prefixes; replace it with a trigram index
+            self._drop_search_index()
+            schema = {}
+        # A table left without its triggers missed writes and must be rebuilt
+        existed = len(schema) == 2
+        
+        try:
+            self.cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS credentials_fts
+                USING fts5(website, username, content='credentials', content_rowid='id',
+                           tokenize='trigram')
+            """)
+            # IF NOT EXISTS skips a table this SQLite cannot open (e.g. a vault
+            # copied from a newer build), so make sure it is usable
+            self.cursor.execute("SELECT rowid FROM credentials_fts LIMIT 0")
+        except sqlite3.OperationalError:
+            # No FTS5 or trigram support; search falls back to LIKE. The sync
+            # triggers would make every write to credentials fail, so drop them
+            self._drop_search_index()
+            return False
+        
+        self.cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS credentials_fts_insert
+            AFTER INSERT ON credentials BEGIN
+                INSERT INTO credentials_fts (rowid, website, username)
+                VALUES (new.id, new.website, new.username);
+            END
+        """)
+        self.cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS credentials_fts_delete
+            AFTER DELETE ON credentials BEGIN
+                INSERT INTO credentials_fts (credentials_fts, rowid, website, username)
+                VALUES ('delete', old.id, old.website, old.username);
+            END
+        """)
+        self.cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS credentials_fts_update
+            AFTER UPDATE OF website, username ON credentials BEGIN
+                INSERT INTO credentials_fts (credentials_fts, rowid, website, username)
+                VALUES ('delete', old.id, old.website, old.username);
+                INSERT INTO credentials_fts (rowid, website, username)
+                VALUES (new.id, new.website, new.username);
+            END
+        """)
+        
+        if not existed:
+            # Index rows stored before the FTS table was introduced
+            self.cursor.execute("""
+                INSERT INTO credentials_fts (credentials_fts) VALUES ('rebuild')
+            """)
+        return True
+    
+    def _drop_search_index(self):
+        """Remove the FTS5 index and the triggers that keep it in sync."""
+        for trigger in ("credentials_fts_insert", "credentials_fts_delete",
+                        "credentials_fts_update"):
+            self.cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        try:
+            self.cursor.execute("DROP TABLE IF EXISTS credentials_fts")
+        except sqlite3.OperationalError:
+            pass  # SQLite without FTS5 cannot drop it; nothing writes to it now
+    
+    def _fetch_dicts(self, rows: List[tuple]) -> List[Dict[str, Any]]:
+        """
+        Convert plain tuple rows from the last query into dictionaries.
+        
+        Column names are read once per result set instead of once per row,
+        and no intermediate sqlite3.Row objects are allocated.
+        
+        Args:
+            rows: Rows fetched from self.cursor
+            
+        Returns:
+            List of column-name -> value dictionaries
+        """
+        columns = [column[0] for column in self.cursor.description]
+        return [dict(zip(columns, row)) for row in rows]
+    
     def set_master_password_hash(self, password_hash: str):
         """
         Store the Master Password hash.
@@ -70,7 +207,7 @@ class Database:
             SELECT value FROM settings WHERE key = 'master_password_hash'
         """)
         result = self.cursor.fetchone()
-        return result['value'] if result else None
+        return result[0] if result else None
     
     def is_first_run(self) -> bool:
         """
@@ -81,7 +218,7 @@ class Database:
         """
         return self.get_master_password_hash() is None
     
-    def add_credential(self, website: str, username: str, encrypted_password: str,
+    def add_credential(self, website: str, username: str, encrypted_password: bytes,
                       url: str = "", notes: str = "") -> int:
         """
         Add a new credential to the vault.
@@ -89,7 +226,7 @@ class Database:
         Args:
             website: Website/service name
             username: Username or email
-            encrypted_password: Encrypted password
+            encrypted_password: Encrypted password (raw AES-GCM bytes)
             url: Optional URL
             notes: Optional notes
             
@@ -103,6 +240,19 @@ class Database:
         self.conn.commit()
         return self.cursor.lastrowid
     
+    def add_credentials_bulk(self, rows: List[tuple]):
+        """
+        Add many credentials in a single transaction.
+        
+        Args:
+            rows: Tuples of (website, username, encrypted_password, url, notes)
+        """
+        with self.conn:  # One commit (and fsync) for the whole batch
+            self.cursor.executemany("""
+                INSERT INTO credentials (website, username, encrypted_password, url, notes)
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
+    
     def get_credential(self, credential_id: int) -> Optional[Dict[str, Any]]:
         """
         Retrieve a single credential by ID.
@@ -116,8 +266,8 @@ class Database:
         self.cursor.execute("""
             SELECT * FROM credentials WHERE id = ?
         """, (credential_id,))
-        result = self.cursor.fetchone()
-        return dict(result) if result else None
+        rows = self._fetch_dicts(self.cursor.fetchmany(1))
+        return rows[0] if rows else None
     
     def get_all_credentials(self) -> List[Dict[str, Any]]:
         """
@@ -129,28 +279,83 @@ class Database:
         self.cursor.execute("""
             SELECT * FROM credentials ORDER BY website, username
         """)
-        return [dict(row) for row in self.cursor.fetchall()]
+        return self._fetch_dicts(self.cursor.fetchall())
+    
+    def list_credentials(self) -> List[Dict[str, Any]]:
+        """
+        List all credentials without their encrypted passwords.
+        
+        List views only show these columns; fetch the password on demand
+        with get_encrypted_password.
+        
+        Returns:
+            List of dictionaries with id, website, username and url
+        """
+        self.cursor.execute("""
+            SELECT id, website, username, url FROM credentials
+            ORDER BY website, username
+        """)
+        return self._fetch_dicts(self.cursor.fetchall())
+    
+    def get_encrypted_password(self, credential_id: int) -> Optional[bytes]:
+        """
+        Retrieve only the encrypted password of a credential.
+        
+        Args:
+            credential_id: The credential ID
+            
+        Returns:
+            The encrypted password, or None if not found
+        """
+        self.cursor.execute("""
+            SELECT encrypted_password FROM credentials WHERE id = ?
+        """, (credential_id,))
+        result = self.cursor.fetchone()
+        return result[0] if result else None
     
     def search_credentials(self, query: str) -> List[Dict[str, Any]]:
         """
         Search credentials by website or username.
         
+        Matches the query as a substring of either field, listing entries
+        that start with it first. Uses the trigram FTS5 index when
+        available and the query has at least three characters, otherwise
+        a LIKE scan. Like list_credentials, results omit the encrypted
+        password.
+        
         Args:
             query: Search term
             
         Returns:
-            List of matching credential dictionaries
+            List of dictionaries with id, website, username and url
         """
-        search_pattern = f"%{query}%"
-        self.cursor.execute("""
-            SELECT * FROM credentials 
-            WHERE website LIKE ? OR username LIKE ?
-            ORDER BY website, username
-        """, (search_pattern, search_pattern))
-        return [dict(row) for row in self.cursor.fetchall()]
+        if not query.strip():
+            return self.list_credentials()
+        
+        # Escape LIKE wildcards so user input is matched literally
+        escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        
+        # Trigram MATCH needs at least three characters. The whole query is
+        # one quoted phrase, so it matches the same rows as LIKE '%query%'
+        if self.has_fts and len(query) >= 3:
+            self.cursor.execute(r"""
+                SELECT c.id, c.website, c.username, c.url FROM credentials_fts f
+                JOIN credentials c ON c.id = f.rowid
+                WHERE credentials_fts MATCH ?1
+                ORDER BY (c.website LIKE ?2 ESCAPE '\' OR c.username LIKE ?2 ESCAPE '\') DESC,
+                         c.website, c.username
+            """, ('"' + query.replace('"', '""') + '"', escaped + "%"))
+        else:
+            self.cursor.execute(r"""
+                SELECT id, website, username, url FROM credentials
+                WHERE website LIKE ?1 ESCAPE '\' OR username LIKE ?1 ESCAPE '\'
+                ORDER BY (website LIKE ?2 ESCAPE '\' OR username LIKE ?2 ESCAPE '\') DESC,
+                         website, username
+            """, ("%" + escaped + "%", escaped + "%"))
+        return self._fetch_dicts(self.cursor.fetchall())
     
     def update_credential(self, credential_id: int, website: str = None,
-                         username: str = None, encrypted_password: str = None,
+                         username: str = None, encrypted_password: bytes = None,
                          url: str = None, notes: str = None):
         """
         Update an existing credential.
@@ -163,37 +368,29 @@ class Database:
             url: New URL (optional)
             notes: New notes (optional)
         """
-        # Build update query dynamically based on provided fields
-        updates = []
-        values = []
-        
-        if website is not None:
-            updates.append("website = ?")
-            values.append(website)
-        if username is not None:
-            updates.append("username = ?")
-            values.append(username)
-        if encrypted_password is not None:
-            updates.append("encrypted_password = ?")
-            values.append(encrypted_password)
-        if url is not None:
-            updates.append("url = ?")
-            values.append(url)
-        if notes is not None:
-            updates.append("notes = ?")
-            values.append(notes)
-        
-        if not updates:
+        if (website is None and username is None and encrypted_password is None
+                and url is None and notes is None):
             return  # Nothing to update
         
-        updates.append("modified_at = ?")
-        values.append(datetime.now().isoformat())
-        values.append(credential_id)
-        
-        query = f"UPDATE credentials SET {', '.join(updates)} WHERE id = ?"
-        self.cursor.execute(query, values)
+        self.cursor.execute(self._UPDATE_SQL, (website, username, encrypted_password,
+                                               url, notes, credential_id))
         self.conn.commit()
     
+    def update_credentials_bulk(self, rows: List[tuple]):
+        """
+        Update many credentials in a single transaction.
+        
+        Args:
+            rows: Tuples of (credential_id, website, username,
+                  encrypted_password, url, notes); None leaves a field unchanged
+        """
+        with self.conn:
+            # Like update_credential, rows with nothing to change are skipped
+            # so they don't touch modified_at or rewrite the search index
+            self.cursor.executemany(self._UPDATE_SQL,
+                                    (row[1:] + row[:1] for row in rows
+                                     if any(field is not None for field in row[1:])))
+    
     def delete_credential(self, credential_id: int):
         """
         Delete a credential from the vault.
@@ -206,6 +403,18 @@ class Database:
         """, (credential_id,))
         self.conn.commit()
     
+    def delete_credentials_bulk(self, credential_ids: List[int]):
+        """
+        Delete many credentials in a single transaction.
+        
+        Args:
+            credential_ids: The credential IDs to delete
+        """
+        with self.conn:
+            self.cursor.executemany("""
+                DELETE FROM credentials WHERE id = ?
+            """, ((credential_id,) for credential_id in credential_ids))
+    
     def close(self):
         """Close the database connection."""
         self.conn.close()
@@ -4,11 +4,13 @@ Modern dark-mode desktop application using CustomTkinter.
 """
 
 import customtkinter as ctk
-from tkinter import messagebox
-import pyperclip
-import threading
+from tkinter import TclError, messagebox
+import atexit
+import hashlib
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Callable
-from datetime import datetime
 
 from crypto_manager import CryptoManager
 from database import Database
@@ -18,22 +20,51 @@ from password_generator import generate_password, estimate_password_strength
 class PasswordManagerGUI:
     """Main GUI application for the password manager."""
     
+    AUTO_LOCK_SECONDS = 300  # Lock after 5 minutes of inactivity
+    AUTO_LOCK_POLL_MS = 10_000
+    CARD_BATCH_SIZE = 20  # Cards built per idle tick when painting the list
+    
     def __init__(self):
         """Initialize the GUI application."""
         self.root = ctk.CTk()
         self.root.title("Secure Password Manager")
         self.root.geometry("900x650")
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
         # Set dark theme
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
         
+        # Shared font objects, created once: Tk resolves each named font a
+        # single time instead of once per widget on every screen rebuild
+        self._fonts = {
+            "title": ctk.CTkFont(family="Helvetica", size=24, weight="bold"),
+            "heading": ctk.CTkFont(family="Helvetica", size=20, weight="bold"),
+            "card_title": ctk.CTkFont(family="Helvetica", size=16, weight="bold"),
+            "button": ctk.CTkFont(family="Helvetica", size=14, weight="bold"),
+            "body": ctk.CTkFont(family="Helvetica", size=14),
+            "small": ctk.CTkFont(family="Helvetica", size=12),
+            "caption": ctk.CTkFont(family="Helvetica", size=10),
+            "mono": ctk.CTkFont(family="Courier", size=16, weight="bold"),
+        }
+        
         # Application state
         self.db = Database()
         self.crypto_manager: Optional[CryptoManager] = None
         self.is_locked = True
-        self.auto_lock_timer: Optional[threading.Timer] = None
-        self.clipboard_timer: Optional[threading.Timer] = None
+        self._cred_cache: Optional[list[dict]] = None
+        self._last_activity = time.monotonic()
+        self._auto_lock_after_id: Optional[str] = None
+        self._clip_after_id: Optional[str] = None
+        self._clipboard_digest: Optional[bytes] = None  # SHA-256 of what we copied
+        
+        # Runs the slow KDF/bcrypt work so the Tk main loop keeps painting
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        
+        # Explicit shutdown instead of relying on a finalizer; atexit also
+        # covers interpreter exits that bypass the window's close button
+        self._closed = False
+        atexit.register(self._on_close)
         
         # Start the appropriate screen
         if self.db.is_first_run():
@@ -42,19 +73,87 @@ class PasswordManagerGUI:
             self.show_login_screen()
     
     def reset_auto_lock(self):
-        """Reset the auto-lock timer (5 minutes of inactivity)."""
-        if self.auto_lock_timer:
-            self.auto_lock_timer.cancel()
-        
-        if not self.is_locked:
-            self.auto_lock_timer = threading.Timer(300, self.lock_vault)  # 5 minutes
-            self.auto_lock_timer.daemon = True
-            self.auto_lock_timer.start()
+        """Record user activity; called on every mouse move and key press."""
+        self._last_activity = time.monotonic()
+    
+    def start_auto_lock(self):
+        """Start polling for inactivity (replaces any running poll)."""
+        self.reset_auto_lock()
+        if self._auto_lock_after_id is not None:
+            self.root.after_cancel(self._auto_lock_after_id)
+        self._auto_lock_after_id = self.root.after(self.AUTO_LOCK_POLL_MS, self._auto_lock_poll)
+    
+    def _auto_lock_poll(self):
+        """Lock the vault once it has been idle for AUTO_LOCK_SECONDS."""
+        self._auto_lock_after_id = None
+        if self.is_locked:
+            return
+        if time.monotonic() - self._last_activity > self.AUTO_LOCK_SECONDS:
+            self.lock_vault()
+        else:
+            self._auto_lock_after_id = self.root.after(self.AUTO_LOCK_POLL_MS, self._auto_lock_poll)
+    
+    def _schedule_clipboard_clear(self, plaintext: str):
+        """Clear the clipboard in 30 seconds unless the user copied something else."""
+        self._cancel_clipboard_clear()
+        
+        # Keep only a digest, never the secret itself
+        self._clipboard_digest = hashlib.sha256(plaintext.encode()).digest()
+        # Tk's own timer runs the callback on the main thread; no extra thread
+        self._clip_after_id = self.root.after(30_000, self._clear_clipboard)
+    
+    def _cancel_clipboard_clear(self):
+        """Cancel a pending clipboard clear, if any."""
+        if self._clip_after_id is not None:
+            self.root.after_cancel(self._clip_after_id)
+            self._clip_after_id = None
+    
+    def _clear_clipboard(self):
+        """Clear the clipboard if it still holds the secret we copied."""
+        self._clip_after_id = None
+        digest, self._clipboard_digest = self._clipboard_digest, None
+        if digest is None:
+            return
+        current = self._clip_get()
+        if hashlib.sha256(current.encode()).digest() == digest:
+            self._clip_set("")
+    
+    def _clip_set(self, text: str):
+        """Replace the clipboard contents with text."""
+        if sys.platform == "win32":
+            import pyperclip  # Tk's Windows clipboard integration is weaker
+            pyperclip.copy(text)
+            return
+        # Tk serves the clipboard over its existing display connection, so
+        # no xclip/xsel process is spawned and the secret never hits argv
+        self.root.clipboard_clear()
+        self.root.clipboard_append(text)
+        self.root.update_idletasks()
+    
+    def _clip_get(self) -> str:
+        """Return the clipboard text, or an empty string if there is none."""
+        if sys.platform == "win32":
+            import pyperclip
+            return pyperclip.paste() or ""
+        try:
+            return self.root.clipboard_get()
+        except TclError:
+            return ""
     
     def clear_window(self):
         """Clear all widgets from the window."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        # Unmap now so the next screen draws immediately; pay the per-widget
+        # <Destroy> cost once Tk is idle
+        widgets = self.root.winfo_children()
+        for widget in widgets:
+            manager = widget.winfo_manager()
+            if manager == "pack":
+                widget.pack_forget()
+            elif manager == "grid":
+                widget.grid_forget()
+            elif manager == "place":
+                widget.place_forget()
+        self.root.after_idle(lambda: [w.destroy() for w in widgets if w.winfo_exists()])
     
     # ==================== SETUP SCREEN ====================
     
@@ -66,13 +165,13 @@ class PasswordManagerGUI:
         frame.pack(expand=True, fill="both", padx=40, pady=40)
         
         title = ctk.CTkLabel(frame, text="🔐 Welcome to Secure Password Manager",
-                            font=("Helvetica", 24, "bold"))
+                            font=self._fonts["title"])
         title.pack(pady=20)
         
         subtitle = ctk.CTkLabel(frame, 
                                text="Create your Master Password\n" +
                                     "⚠️ This password cannot be recovered if forgotten!",
-                               font=("Helvetica", 12))
+                               font=self._fonts["small"])
         subtitle.pack(pady=10)
         
         # Password requirements
@@ -80,7 +179,7 @@ class PasswordManagerGUI:
                                    text="Requirements:\n" +
                                         "• At least 8 characters\n" +
                                         "• 3 of: uppercase, lowercase, digit, special character",
-                                   font=("Helvetica", 10),
+                                   font=self._fonts["caption"],
                                    justify="left")
         requirements.pack(pady=10)
         
@@ -105,11 +204,20 @@ class PasswordManagerGUI:
                                        variable=show_var, command=toggle_password)
         show_checkbox.pack(pady=10)
         
+        # Lower the bcrypt cost to what this CPU hashes in ~0.1 s
+        fast_var = ctk.BooleanVar(value=False)
+        fast_checkbox = ctk.CTkCheckBox(frame, text="Faster unlock (for slower devices)",
+                                       variable=fast_var)
+        fast_checkbox.pack(pady=(0, 10))
+        
         # Error label
         error_label = ctk.CTkLabel(frame, text="", text_color="red")
         error_label.pack(pady=5)
         
         def create_master_password():
+            if create_btn.cget("state") == "disabled":
+                return  # Setup already in progress
+            
             password = password_entry.get()
             confirm = confirm_entry.get()
             
@@ -128,12 +236,31 @@ class PasswordManagerGUI:
                 error_label.configure(text=error_msg)
                 return
             
-            # Create hash and store
-            password_hash = CryptoManager.hash_master_password(password)
+            # Hash and derive the key off the Tk thread
+            fast_mode = fast_var.get()
+            create_btn.configure(state="disabled")
+            progress.pack(pady=5)
+            progress.start()
+            future = self._executor.submit(
+                lambda: (CryptoManager.hash_master_password(password, fast_mode=fast_mode),
+                         CryptoManager(password)))
+            self.root.after(50, check_setup, future)
+        
+        def check_setup(future: Future):
+            if not future.done():
+                self.root.after(50, check_setup, future)
+                return
+            
+            progress.stop()
+            progress.pack_forget()
+            create_btn.configure(state="normal")
+            password_hash, crypto_manager = future.result()
+            
+            # Store hash (SQLite stays on the Tk thread)
             self.db.set_master_password_hash(password_hash)
             
             # Initialize crypto manager
-            self.crypto_manager = CryptoManager(password)
+            self.crypto_manager = crypto_manager
             self.is_locked = False
             
             messagebox.showinfo("Success", 
@@ -145,10 +272,12 @@ class PasswordManagerGUI:
         
         create_btn = ctk.CTkButton(frame, text="Create Master Password",
                                   command=create_master_password,
-                                  font=("Helvetica", 14, "bold"),
+                                  font=self._fonts["button"],
                                   height=40)
         create_btn.pack(pady=20)
         
+        progress = ctk.CTkProgressBar(frame, mode="indeterminate", width=300)
+        
         # Bind Enter key
         confirm_entry.bind("<Return>", lambda e: create_master_password())
     
@@ -162,16 +291,16 @@ class PasswordManagerGUI:
         frame.pack(expand=True, fill="both", padx=40, pady=40)
         
         title = ctk.CTkLabel(frame, text="🔐 Secure Password Manager",
-                            font=("Helvetica", 24, "bold"))
+                            font=self._fonts["title"])
         title.pack(pady=30)
         
         subtitle = ctk.CTkLabel(frame, text="Enter your Master Password to unlock",
-                               font=("Helvetica", 12))
+                               font=self._fonts["small"])
         subtitle.pack(pady=10)
         
         # Password input
         password_entry = ctk.CTkEntry(frame, width=300, show="*",
-                                     font=("Helvetica", 14))
+                                     font=self._fonts["body"])
         password_entry.pack(pady=20)
         password_entry.focus()
         
@@ -190,31 +319,52 @@ class PasswordManagerGUI:
         error_label.pack(pady=5)
         
         def unlock_vault():
+            if unlock_btn.cget("state") == "disabled":
+                return  # Unlock already in progress
+            
             password = password_entry.get()
             
             if not password:
                 error_label.configure(text="Please enter your Master Password")
                 return
             
-            # Verify password
+            # Verify password and derive the vault key off the Tk thread
             stored_hash = self.db.get_master_password_hash()
-            if not CryptoManager.verify_master_password(password, stored_hash):
+            unlock_btn.configure(state="disabled")
+            error_label.configure(text="")
+            progress.pack(pady=5)
+            progress.start()
+            future = self._executor.submit(CryptoManager.unlock, password, stored_hash)
+            self.root.after(50, check_unlock, future)
+        
+        def check_unlock(future: Future):
+            if not future.done():
+                self.root.after(50, check_unlock, future)
+                return
+            
+            progress.stop()
+            progress.pack_forget()
+            unlock_btn.configure(state="normal")
+            crypto_manager = future.result()
+            if crypto_manager is None:
                 error_label.configure(text="Incorrect Master Password")
                 password_entry.delete(0, 'end')
                 return
             
-            # Initialize crypto manager and unlock
-            self.crypto_manager = CryptoManager(password)
+            # Unlock
+            self.crypto_manager = crypto_manager
             self.is_locked = False
             
             self.show_main_dashboard()
         
         unlock_btn = ctk.CTkButton(frame, text="Unlock Vault",
                                   command=unlock_vault,
-                                  font=("Helvetica", 14, "bold"),
+                                  font=self._fonts["button"],
                                   height=40)
         unlock_btn.pack(pady=20)
         
+        progress = ctk.CTkProgressBar(frame, mode="indeterminate", width=300)
+        
         # Bind Enter key
         password_entry.bind("<Return>", lambda e: unlock_vault())
     
@@ -223,7 +373,7 @@ class PasswordManagerGUI:
     def show_main_dashboard(self):
         """Display the main dashboard with credentials and generator."""
         self.clear_window()
-        self.reset_auto_lock()
+        self.start_auto_lock()
         
         # Header frame
         header = ctk.CTkFrame(self.root, height=60)
@@ -231,7 +381,7 @@ class PasswordManagerGUI:
         header.pack_propagate(False)
         
         title = ctk.CTkLabel(header, text="🔐 Password Vault (Unlocked)",
-                            font=("Helvetica", 20, "bold"))
+                            font=self._fonts["heading"])
         title.pack(side="left", padx=20)
         
         lock_btn = ctk.CTkButton(header, text="🔒 Lock Vault",
@@ -268,10 +418,9 @@ class PasswordManagerGUI:
         def search_credentials():
             query = search_entry.get().strip()
             if query:
-                credentials = self.db.search_credentials(query)
+                refresh_list(self.db.search_credentials(query))
             else:
-                credentials = self.db.get_all_credentials()
-            refresh_list(credentials)
+                refresh_list()  # Full list, served from cache when unchanged
         
         search_btn = ctk.CTkButton(search_frame, text="Search", command=search_credentials,
                                   width=100)
@@ -283,7 +432,7 @@ class PasswordManagerGUI:
         clear_btn.pack(side="left", padx=5)
         
         add_btn = ctk.CTkButton(search_frame, text="+ Add New", 
-                               command=lambda: self.show_add_edit_dialog(),
+                               command=lambda: self.show_add_edit_dialog(refresh_callback=refresh_list),
                                width=120, fg_color="green", hover_color="darkgreen")
         add_btn.pack(side="right", padx=5)
         
@@ -291,51 +440,119 @@ class PasswordManagerGUI:
         list_frame = ctk.CTkScrollableFrame(parent)
         list_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
+        no_data = ctk.CTkLabel(list_frame, text="No credentials saved yet.\nClick '+ Add New' to get started!",
+                              font=self._fonts["body"])
+        
+        # Last full credential list; reset to None whenever the vault changes
+        self._cred_cache = None
+        
+        # Card pool keyed by credential id; cards are reused across refreshes
+        self._card_widgets: dict[int, ctk.CTkFrame] = {}
+        card_data: dict[int, dict] = {}
+        shown_order: list[int] = []  # Cards packed so far
+        painting_order: list[int] = []  # Order the latest paint is working toward
+        paint_generation = 0  # Bumped by each repaint to cancel older paints
+        
         def refresh_list(credentials=None):
-            """Refresh the credentials list."""
-            # Clear existing
-            for widget in list_frame.winfo_children():
-                widget.destroy()
+            """Refresh the credentials list, rebuilding only changed cards."""
+            nonlocal paint_generation
+            full_list = credentials is None
+            if full_list:
+                if self._cred_cache is None:
+                    self._cred_cache = self.db.list_credentials()
+                credentials = self._cred_cache
+            new_creds = {cred['id']: cred for cred in credentials}
+            
+            # Rebuild cards whose data changed; a full list also drops
+            # cards of deleted credentials (search results just hide them)
+            for cred_id in list(self._card_widgets):
+                cred = new_creds.get(cred_id)
+                if (cred is not None and cred != card_data[cred_id]) or (cred is None and full_list):
+                    self._card_widgets.pop(cred_id).destroy()
+                    del card_data[cred_id]
+                    if cred_id in shown_order:
+                        shown_order.remove(cred_id)
             
-            if credentials is None:
-                credentials = self.db.get_all_credentials()
+            # Re-pack only when the visible set or its order changed. A paint
+            # still in flight toward another order must be cancelled even if
+            # the cards it has packed so far happen to match
+            order = [cred['id'] for cred in credentials]
+            if order != shown_order or order != painting_order:
+                for cred_id in shown_order:
+                    self._card_widgets[cred_id].pack_forget()
+                shown_order.clear()
+                painting_order[:] = order
+                paint_generation += 1
+                paint_batch(paint_generation, order, new_creds, 0)
             
-            if not credentials:
-                no_data = ctk.CTkLabel(list_frame, text="No credentials saved yet.\nClick '+ Add New' to get started!",
-                                      font=("Helvetica", 14))
+            if credentials:
+                no_data.pack_forget()
+            else:
                 no_data.pack(pady=50)
-                return
+        
+        def paint_batch(generation, order, creds, start):
+            """Build and pack one batch of cards, then yield to the event loop."""
+            if generation != paint_generation or not list_frame.winfo_exists():
+                return  # Superseded by a newer refresh, or the tab is gone
+            for cred_id in order[start:start + self.CARD_BATCH_SIZE]:
+                card = self._card_widgets.get(cred_id)
+                if card is None:
+                    card = self.create_credential_card(list_frame, creds[cred_id], refresh_list)
+                    self._card_widgets[cred_id] = card
+                    card_data[cred_id] = creds[cred_id]
+                card.pack(fill="x", padx=5, pady=5)
+                shown_order.append(cred_id)
             
-            # Create credential cards
-            for cred in credentials:
-                self.create_credential_card(list_frame, cred, refresh_list)
+            start += self.CARD_BATCH_SIZE
+            if start < len(order):
+                # Input and redraws are handled before the next batch runs
+                self.root.after_idle(paint_batch, generation, order, creds, start)
         
         # Initial load
         refresh_list()
         
         # Bind Enter key to search
         search_entry.bind("<Return>", lambda e: search_credentials())
+        
+        # Search as the user types, once typing pauses for 150 ms
+        search_after_id = None
+        
+        def schedule_search(event):
+            nonlocal search_after_id
+            if event.keysym == "Return":
+                return  # Already handled by the <Return> binding
+            if search_after_id is not None:
+                self.root.after_cancel(search_after_id)
+            search_after_id = self.root.after(150, run_scheduled_search)
+        
+        def run_scheduled_search():
+            nonlocal search_after_id
+            search_after_id = None
+            if self.is_locked or not search_entry.winfo_exists():
+                return  # Vault was locked or closed while the timer was pending
+            search_credentials()
+        
+        search_entry.bind("<KeyRelease>", schedule_search)
     
-    def create_credential_card(self, parent, cred: dict, refresh_callback: Callable):
-        """Create a credential card widget."""
+    def create_credential_card(self, parent, cred: dict, refresh_callback: Callable) -> ctk.CTkFrame:
+        """Create a credential card widget (left unpacked for the caller to place)."""
         card = ctk.CTkFrame(parent, corner_radius=10)
-        card.pack(fill="x", padx=5, pady=5)
         
         # Left side: Info
         info_frame = ctk.CTkFrame(card, fg_color="transparent")
         info_frame.pack(side="left", fill="both", expand=True, padx=15, pady=10)
         
         website_label = ctk.CTkLabel(info_frame, text=cred['website'],
-                                     font=("Helvetica", 16, "bold"))
+                                     font=self._fonts["card_title"])
         website_label.pack(anchor="w")
         
         username_label = ctk.CTkLabel(info_frame, text=f"👤 {cred['username']}",
-                                      font=("Helvetica", 12))
+                                      font=self._fonts["small"])
         username_label.pack(anchor="w", pady=(3, 0))
         
         if cred.get('url'):
             url_label = ctk.CTkLabel(info_frame, text=f"🔗 {cred['url']}",
-                                    font=("Helvetica", 10), text_color="gray")
+                                    font=self._fonts["caption"], text_color="gray")
             url_label.pack(anchor="w", pady=(3, 0))
         
         # Right side: Actions
@@ -343,29 +560,27 @@ class PasswordManagerGUI:
         actions_frame.pack(side="right", padx=10, pady=10)
         
         def copy_username():
-            pyperclip.copy(cred['username'])
+            self._clip_set(cred['username'])
             messagebox.showinfo("Copied", f"Username copied to clipboard")
         
         def copy_password():
-            decrypted = self.crypto_manager.decrypt(cred['encrypted_password'])
-            pyperclip.copy(decrypted)
+            # Cards only hold list columns; fetch the ciphertext on demand
+            encrypted = self.db.get_encrypted_password(cred['id'])
+            decrypted = self.crypto_manager.decrypt(encrypted)
+            self._clip_set(decrypted)
             
             # Auto-clear clipboard after 30 seconds
-            if self.clipboard_timer:
-                self.clipboard_timer.cancel()
-            
-            self.clipboard_timer = threading.Timer(30, lambda: pyperclip.copy(""))
-            self.clipboard_timer.daemon = True
-            self.clipboard_timer.start()
+            self._schedule_clipboard_clear(decrypted)
             
             messagebox.showinfo("Copied", "Password copied!\nClipboard will clear in 30 seconds.")
         
         def edit_credential():
-            self.show_add_edit_dialog(cred, refresh_callback)
+            self.show_add_edit_dialog(self.db.get_credential(cred['id']), refresh_callback)
         
         def delete_credential():
             if messagebox.askyesno("Confirm Delete",
                                   f"Delete credential for {cred['website']}?"):
+                self._cred_cache = None
                 self.db.delete_credential(cred['id'])
                 refresh_callback()
         
@@ -386,6 +601,8 @@ class PasswordManagerGUI:
                                   command=delete_credential, width=80,
                                   fg_color="darkred", hover_color="red")
         delete_btn.grid(row=1, column=1, padx=3, pady=2)
+        
+        return card
     
     def show_add_edit_dialog(self, credential: dict = None, refresh_callback: Callable = None):
         """Show dialog for adding or editing a credential."""
@@ -457,6 +674,7 @@ class PasswordManagerGUI:
                 return
             
             encrypted_pass = self.crypto_manager.encrypt(password)
+            self._cred_cache = None
             
             if credential:
                 # Update existing
@@ -477,7 +695,7 @@ class PasswordManagerGUI:
                 refresh_callback()
         
         save_btn = ctk.CTkButton(frame, text="Save", command=save_credential,
-                                font=("Helvetica", 14, "bold"),
+                                font=self._fonts["button"],
                                 height=40, fg_color="green", hover_color="darkgreen")
         save_btn.pack(pady=10)
         
@@ -491,12 +709,12 @@ class PasswordManagerGUI:
         frame.pack(fill="both", expand=True, padx=20, pady=20)
         
         title = ctk.CTkLabel(frame, text="🎲 Password Generator",
-                            font=("Helvetica", 20, "bold"))
+                            font=self._fonts["heading"])
         title.pack(pady=20)
         
         # Length slider
         length_label = ctk.CTkLabel(frame, text="Password Length: 16",
-                                   font=("Helvetica", 14))
+                                   font=self._fonts["body"])
         length_label.pack(pady=(10, 5))
         
         length_slider = ctk.CTkSlider(frame, from_=12, to=64, number_of_steps=52,
@@ -525,13 +743,13 @@ class PasswordManagerGUI:
         
         # Generated password display
         password_display = ctk.CTkTextbox(frame, width=500, height=80,
-                                         font=("Courier", 16, "bold"))
+                                         font=self._fonts["mono"])
         password_display.pack(pady=20)
         password_display.insert("1.0", "Click 'Generate' to create a password")
         password_display.configure(state="disabled")
         
         # Strength indicator
-        strength_label = ctk.CTkLabel(frame, text="", font=("Helvetica", 12))
+        strength_label = ctk.CTkLabel(frame, text="", font=self._fonts["small"])
         strength_label.pack(pady=5)
         
         def generate_new():
@@ -559,15 +777,10 @@ class PasswordManagerGUI:
         def copy_generated():
             password = password_display.get("1.0", "end").strip()
             if password and password != "Click 'Generate' to create a password":
-                pyperclip.copy(password)
+                self._clip_set(password)
                 
                 # Auto-clear clipboard
-                if self.clipboard_timer:
-                    self.clipboard_timer.cancel()
-                
-                self.clipboard_timer = threading.Timer(30, lambda: pyperclip.copy(""))
-                self.clipboard_timer.daemon = True
-                self.clipboard_timer.start()
+                self._schedule_clipboard_clear(password)
                 
                 messagebox.showinfo("Copied", "Password copied!\nClipboard will clear in 30 seconds.")
         
@@ -577,7 +790,7 @@ class PasswordManagerGUI:
         
         generate_btn = ctk.CTkButton(btn_frame, text="🎲 Generate Password",
                                     command=generate_new,
-                                    font=("Helvetica", 14, "bold"),
+                                    font=self._fonts["button"],
                                     width=200, height=45,
                                     fg_color="green", hover_color="darkgreen")
         generate_btn.grid(row=0, column=0, padx=10)
@@ -591,27 +804,54 @@ class PasswordManagerGUI:
     def lock_vault(self):
         """Lock the vault and return to login screen."""
         self.is_locked = True
+        if self.crypto_manager is not None:
+            self.crypto_manager.wipe()
         self.crypto_manager = None
+        self._cred_cache = None
         
         # Cancel timers
-        if self.auto_lock_timer:
-            self.auto_lock_timer.cancel()
-        if self.clipboard_timer:
-            self.clipboard_timer.cancel()
+        if self._auto_lock_after_id is not None:
+            self.root.after_cancel(self._auto_lock_after_id)
+            self._auto_lock_after_id = None
+        self._cancel_clipboard_clear()
         
         # Clear clipboard for security
-        pyperclip.copy("")
+        self._clear_clipboard()
         
         self.show_login_screen()
     
+    def _on_close(self):
+        """Release the vault and tear down the window; safe to call twice."""
+        if self._closed:
+            return
+        self._closed = True
+        self.is_locked = True
+        
+        try:
+            if self._auto_lock_after_id is not None:
+                self.root.after_cancel(self._auto_lock_after_id)
+                self._auto_lock_after_id = None
+            self._cancel_clipboard_clear()
+            self._clear_clipboard()
+        except TclError:
+            pass  # Tk is already gone (e.g. atexit after an abnormal exit)
+        
+        if self.crypto_manager is not None:
+            self.crypto_manager.wipe()
+            self.crypto_manager = None
+        self._cred_cache = None
+        self.db.close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        
+        try:
+            self.root.quit()
+            self.root.destroy()
+        except TclError:
+            pass
+    
     def run(self):
         """Start the GUI main loop."""
         self.root.mainloop()
-    
-    def __del__(self):
-        """Cleanup on exit."""
-        if hasattr(self, 'db'):
-            self.db.close()
 
 
 if __name__ == "__main__":
@@ -9,33 +9,19 @@ A zero-knowledge password manager that:
 - Auto-locks after inactivity and clears clipboard for security
 """
 
+import importlib.util
 import sys
 import os
 
 
 def check_dependencies():
     """Check if all required dependencies are installed."""
-    missing = []
-    
-    try:
-        import cryptography
-    except ImportError:
-        missing.append("cryptography")
-    
-    try:
-        import pyperclip
-    except ImportError:
-        missing.append("pyperclip")
-    
-    try:
-        import customtkinter
-    except ImportError:
-        missing.append("customtkinter")
-    
-    try:
-        import bcrypt
-    except ImportError:
-        missing.append("bcrypt")
+    # find_spec locates each package without executing it, so the heavy
+    # C extensions load only when the crypto code actually needs them
+    required = ["cryptography", "customtkinter", "bcrypt"]
+    if sys.platform == "win32":
+        required.append("pyperclip")  # Clipboard backend on Windows only
+    missing = [name for name in required if importlib.util.find_spec(name) is None]
     
     if missing:
         print("ERROR: Missing required dependencies!")
@@ -1,10 +1,256 @@
 """
 Secure Password Generation Module
-Generates cryptographically strong random passwords using the secrets module.
+Generates cryptographically strong random passwords from the OS CSPRNG
+(os.urandom), read through a per-thread buffer.
 """
 
-import secrets
+import bisect
+import functools
+import itertools
+import math
+import os
 import string
+import threading
+from typing import Callable
+
+_SYMBOLS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+_SYMBOLS_SET = frozenset(_SYMBOLS)
+
+
+def _classify(c: str) -> int:
+    """Return the character-class bit of c (upper=1, lower=2, digit=4, symbol=8)."""
+    if c.isupper():
+        return 1
+    if c.islower():
+        return 2
+    if c.isdigit():
+        return 4
+    if c in _SYMBOLS_SET:
+        return 8
+    return 0
+
+
+# Byte -> character-class bit, for single-pass classification of ASCII text
+_CLASS_TABLE = bytes(_classify(chr(i)) if i < 128 else 0 for i in range(256))
+
+# Character pools for every (uppercase, lowercase, digits, symbols) flag
+# combination, built once: the full pool and its per-class subpools
+_SUBPOOLS = tuple(pool.encode() for pool in (string.ascii_uppercase, string.ascii_lowercase,
+                                             string.digits, _SYMBOLS))
+_REQUIRED_SUBPOOLS: dict[tuple[bool, bool, bool, bool], tuple[bytes, ...]] = {}
+_POOLS: dict[tuple[bool, bool, bool, bool], bytes] = {}
+for _key in itertools.product((False, True), repeat=4):
+    _REQUIRED_SUBPOOLS[_key] = tuple(itertools.compress(_SUBPOOLS, _key))
+    _POOLS[_key] = b"".join(_REQUIRED_SUBPOOLS[_key])
+del _key
+
+# log2 of every pool size estimate_password_strength can produce (sums of
+# the nonempty subsets of the class sizes it assumes)
+_LOG2 = {size: math.log2(size)
+         for r in range(1, 5)
+         for size in map(sum, itertools.combinations((26, 26, 10, 21), r))}
+
+# Entropy thresholds (bits) separating the strength labels
+_STRENGTH_THRESHOLDS = (50, 70, 90)
+_STRENGTH_LABELS = ("Weak", "Fair", "Strong", "Very Strong")
+
+
+class _RandBuf(threading.local):
+    """Per-thread buffer of os.urandom output, refilled in large blocks."""
+    
+    REFILL_SIZE = 4096  # One getrandom syscall covers many passwords
+    
+    def __init__(self):
+        self.buf = b""
+        self.pos = 0
+    
+    def take(self, n: int) -> bytes:
+        """Return the next n unused random bytes."""
+        if self.pos + n > len(self.buf):
+            self.buf = os.urandom(max(self.REFILL_SIZE, n))
+            self.pos = 0
+        out = self.buf[self.pos:self.pos + n]
+        self.pos += n
+        return out
+    
+    def below(self, n: int) -> int:
+        """Return a uniform random integer in [0, n), for 1 <= n <= 256."""
+        mask = (1 << (n - 1).bit_length()) - 1
+        while True:
+            value = self.take(1)[0] & mask
+            if value < n:
+                return value
+
+
+_rand = _RandBuf()
+
+if hasattr(os, "register_at_fork"):
+    # A forked child must not reuse the parent's unread random bytes
+    os.register_at_fork(after_in_child=_rand.__init__)
+
+
+@functools.lru_cache(maxsize=None)
+def _sampling_table(pool: bytes) -> tuple[bytes, bytes]:
+    """
+    Build the bytes.translate arguments that map random bytes onto pool.
+    
+    Bytes below the largest multiple of len(pool) that fits in a byte map
+    to pool[b % len(pool)], so every character is hit by the same number
+    of byte values; the high bytes above that limit are deleted.
+    
+    Args:
+        pool: ASCII characters to draw from (at most 256)
+        
+    Returns:
+        Tuple of (translation table, bytes to delete)
+    """
+    size = len(pool)
+    limit = 256 - 256 % size
+    table = bytes(pool[b % size] for b in range(limit)) + bytes(256 - limit)
+    return table, bytes(range(limit, 256))
+
+
+def _sample(pool: bytes, count: int) -> bytearray:
+    """
+    Draw count characters uniformly from pool using batched random bytes.
+    
+    Mapping and rejection both happen inside one bytes.translate call per
+    batch, so no Python code runs per random byte.
+    
+    Args:
+        pool: ASCII characters to draw from (at most 256)
+        count: Number of characters to draw
+        
+    Returns:
+        The drawn characters
+    """
+    table, rejected = _sampling_table(pool)
+    out = bytearray()
+    while len(out) < count:
+        # At most half of all byte values are rejected for any pool size,
+        # so twice the shortfall almost always finishes in one batch
+        out += _rand.take(2 * (count - len(out))).translate(table, rejected)
+    del out[count:]
+    return out
+
+
+@functools.lru_cache(maxsize=1)
+def _load_bulk_scanner():
+    """
+    JIT-compile the bulk class-mask scanner on first use.
+    
+    Returns:
+        Compiled scanner taking (codes, offsets, table, out) arrays, or None
+        if numba is not installed or cannot compile it here
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    
+    def scan(codes, offsets, table, out):
+        # Password i occupies codes[offsets[i]:offsets[i + 1]]
+        for i in range(out.shape[0]):
+            mask = 0
+            for j in range(offsets[i], offsets[i + 1]):
+                mask |= table[codes[j]]
+                if mask == 15:  # Every class seen
+                    break
+            out[i] = mask
+    
+    try:
+        return njit(cache=True)(scan)
+    except Exception:
+        # e.g. RuntimeError in a frozen build: no source file for numba's
+        # on-disk cache to locate. Fall back to the pure-Python path
+        return None
+
+
+def _rate(flags: int, length: int) -> tuple[str, float]:
+    """
+    Turn the character classes present and the length into a rating.
+    
+    Args:
+        flags: Character-class bits present in the password
+        length: Password length in characters
+        
+    Returns:
+        Tuple of (strength_label, entropy_bits)
+    """
+    # Calculate character pool size
+    pool_size = 0
+    if flags & 1:
+        pool_size += 26
+    if flags & 2:
+        pool_size += 26
+    if flags & 4:
+        pool_size += 10
+    if flags & 8:
+        pool_size += 21
+    
+    # Calculate entropy in bits
+    entropy = length * _LOG2[pool_size] if pool_size > 0 else 0
+    
+    # Classify strength
+    strength = _STRENGTH_LABELS[bisect.bisect_right(_STRENGTH_THRESHOLDS, entropy)]
+    
+    return strength, entropy
+
+
+@functools.lru_cache(maxsize=16)
+def _make_generator(use_uppercase: bool, use_lowercase: bool,
+                    use_digits: bool, use_symbols: bool) -> Callable[[int, int], list[str]]:
+    """
+    Build a password generator specialized for one character-set policy.
+    
+    The pool lookups happen once per flag combination; an application
+    normally uses a single policy, so later calls go straight to the
+    cached closure.
+    
+    Returns:
+        Function taking (count, length) and returning count passwords
+        
+    Raises:
+        ValueError: If no character types selected
+    """
+    if not (use_uppercase or use_lowercase or use_digits or use_symbols):
+        raise ValueError("At least one character type must be selected")
+    
+    key = (bool(use_uppercase), bool(use_lowercase), bool(use_digits), bool(use_symbols))
+    pool = _POOLS[key]
+    subpools = _REQUIRED_SUBPOOLS[key]
+    num_required = len(subpools)
+    
+    def generate(count: int, length: int) -> list[str]:
+        if not 12 <= length <= 64:
+            raise ValueError("Password length must be between 12 and 64 characters")
+        
+        # Fill every position of every password from the full pool, and draw
+        # each password's required per-class characters, in one batch each
+        chars = _sample(pool, count * length)
+        required = [_sample(subpool, count) for subpool in subpools]
+        
+        passwords = []
+        for i in range(count):
+            password = chars[i * length:(i + 1) * length]
+            
+            # Guarantee each selected class by overwriting distinct, uniformly
+            # chosen positions. A list keeps the draw order: a set would iterate
+            # in sorted order and place the classes in a fixed left-to-right order
+            positions = []
+            while len(positions) < num_required:
+                position = _rand.below(length)
+                if position not in positions:
+                    positions.append(position)
+            
+            for position, picks in zip(positions, required):
+                password[position] = picks[i]
+            
+            passwords.append(password.decode("ascii"))
+        
+        return passwords
+    
+    return generate
 
 
 def generate_password(length: int = 16, 
@@ -28,50 +274,32 @@ def generate_password(length: int = 16,
     Raises:
         ValueError: If no character types selected or invalid length
     """
-    # Validate inputs
-    if length < 12 or length > 64:
-        raise ValueError("Password length must be between 12 and 64 characters")
-    
-    if not any([use_uppercase, use_lowercase, use_digits, use_symbols]):
-        raise ValueError("At least one character type must be selected")
-    
-    # Build character pool
-    character_pool = ""
-    required_chars = []
-    
-    if use_uppercase:
-        character_pool += string.ascii_uppercase
-        required_chars.append(secrets.choice(string.ascii_uppercase))
-    
-    if use_lowercase:
-        character_pool += string.ascii_lowercase
-        required_chars.append(secrets.choice(string.ascii_lowercase))
-    
-    if use_digits:
-        character_pool += string.digits
-        required_chars.append(secrets.choice(string.digits))
-    
-    if use_symbols:
-        symbols = "!@#$%^&*()_+-=[]{}|;:,.<>?"
-        character_pool += symbols
-        required_chars.append(secrets.choice(symbols))
-    
-    # Generate password ensuring at least one char from each selected pool
-    remaining_length = length - len(required_chars)
-    
-    # Generate random characters for the rest
-    random_chars = [secrets.choice(character_pool) for _ in range(remaining_length)]
-    
-    # Combine and shuffle
-    password_chars = required_chars + random_chars
-    
-    # Cryptographically secure shuffle
-    # Fisher-Yates shuffle using secrets.randbelow
-    for i in range(len(password_chars) - 1, 0, -1):
-        j = secrets.randbelow(i + 1)
-        password_chars[i], password_chars[j] = password_chars[j], password_chars[i]
+    return _make_generator(use_uppercase, use_lowercase, use_digits, use_symbols)(1, length)[0]
+
+
+def generate_passwords(count: int, length: int = 16,
+                       use_uppercase: bool = True,
+                       use_lowercase: bool = True,
+                       use_digits: bool = True,
+                       use_symbols: bool = True) -> list[str]:
+    """
+    Generate several passwords from shared batched random draws.
     
-    return ''.join(password_chars)
+    Args:
+        count: Number of passwords to generate
+        length: Password length (12-64 characters)
+        use_uppercase: Include uppercase letters (A-Z)
+        use_lowercase: Include lowercase letters (a-z)
+        use_digits: Include digits (0-9)
+        use_symbols: Include special characters
+        
+    Returns:
+        List of count generated password strings
+        
+    Raises:
+        ValueError: If no character types selected or invalid length
+    """
+    return _make_generator(use_uppercase, use_lowercase, use_digits, use_symbols)(count, length)
 
 
 def estimate_password_strength(password: str) -> tuple[str, float]:
@@ -84,33 +312,51 @@ def estimate_password_strength(password: str) -> tuple[str, float]:
     Returns:
         Tuple of (strength_label, entropy_bits)
     """
-    import math
+    # Collect the character classes present in one pass
+    flags = 0
+    if password.isascii():
+        # translate maps every byte to its class bit in C; stop once all
+        # four classes have been seen
+        for bit in password.encode().translate(_CLASS_TABLE):
+            flags |= bit
+            if flags == 15:
+                break
+    else:
+        for c in password:
+            flags |= _classify(c)
     
-    # Calculate character pool size
-    pool_size = 0
-    if any(c.isupper() for c in password):
-        pool_size += 26
-    if any(c.islower() for c in password):
-        pool_size += 26
-    if any(c.isdigit() for c in password):
-        pool_size += 10
-    if any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
-        pool_size += 21
+    return _rate(flags, len(password))
+
+
+def estimate_password_strength_bulk(passwords: list[str]) -> list[tuple[str, float]]:
+    """
+    Estimate the strength of many passwords, e.g. when auditing a vault.
     
-    # Calculate entropy in bits
-    entropy = len(password) * math.log2(pool_size) if pool_size > 0 else 0
+    With numba installed, all ASCII passwords are classified together in
+    one compiled pass; otherwise this is estimate_password_strength per item.
     
-    # Classify strength
-    if entropy < 50:
-        strength = "Weak"
-    elif entropy < 70:
-        strength = "Fair"
-    elif entropy < 90:
-        strength = "Strong"
-    else:
-        strength = "Very Strong"
+    Args:
+        passwords: The passwords to evaluate
+        
+    Returns:
+        List of (strength_label, entropy_bits) tuples, in input order
+    """
+    scan = _load_bulk_scanner()
+    if scan is None:
+        return [estimate_password_strength(password) for password in passwords]
     
-    return strength, entropy
+    import numpy as np  # Always available alongside numba
+    
+    encoded = [password.encode() for password in passwords]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(data) for data in encoded], out=offsets[1:])
+    masks = np.empty(len(encoded), dtype=np.uint8)
+    scan(np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets,
+         np.frombuffer(_CLASS_TABLE, dtype=np.uint8), masks)
+    
+    return [_rate(int(mask), len(password)) if password.isascii()
+            else estimate_password_strength(password)
+            for password, mask in zip(passwords, masks)]
 
 
 if __name__ == "__main__":